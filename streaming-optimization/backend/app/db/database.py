@@ -1,15 +1,22 @@
 """
 This script sets up a database connection for a PostgreSQL database using SQLAlchemy.
-It loads credentials from a .env file, constructs the database URL, and configures a sessionmaker 
+It loads credentials from a .env file (`ENV_FILE`, default: backend/.env), constructs the database URL, and configures a sessionmaker 
 for database interactions. The `get_db` function provides a dependency to manage sessions safely.
+
+Read endpoints use `get_read_db`. If `READ_REPLICA_PATH` points to an SQLite replica built by
+`scripts/load_data.py`, they query it in-process (read-only, no network hop); otherwise they fall back
+to PostgreSQL, which always remains the system of record. `load_data.py` swaps in a rebuilt replica
+atomically; `get_read_db` notices the new file and disposes the pooled connections to the old one.
 """
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import os
+import threading
 
-load_dotenv(dotenv_path="/Users/lucy/Documents/Check24GenDev/streaming-optimization/backend/.env")
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+load_dotenv(dotenv_path=os.getenv("ENV_FILE", os.path.join(BASE_DIR, ".env")))
 
 # Get database credentials from .env
 DB_USER = os.getenv("POSTGRES_USER")
@@ -23,14 +30,72 @@ DB_NAME = os.getenv("POSTGRES_DB")
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 # Create the engine
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 
 # Session-Maker for database interactions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional embedded read replica (SQLite)
+READ_REPLICA_PATH = os.getenv("READ_REPLICA_PATH")
+
+if READ_REPLICA_PATH:
+    read_engine = create_engine(
+        f"sqlite:///file:{os.path.abspath(READ_REPLICA_PATH)}?mode=ro&uri=true",
+        connect_args={"check_same_thread": False},
+        pool_pre_ping=True,
+    )
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+else:
+    read_engine = engine
+    ReadSessionLocal = SessionLocal
+
+def _replica_file_id():
+    """Identifiziert die Replik-Datei; os.replace erzeugt eine neue Datei (neuer Inode)."""
+    try:
+        stat = os.stat(READ_REPLICA_PATH)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns)
+
+_replica_lock = threading.Lock()
+# Wird bei jedem Verwerfen der Replik-Verbindungen erhöht; Caches erkennen daran einen Austausch
+_read_engine_generation = 0
+# Beim Erstellen der Engine festhalten, damit auch ein Austausch vor der ersten Anfrage erkannt wird
+_engine_replica_file_id = _replica_file_id() if READ_REPLICA_PATH else None
+
+def refresh_read_engine():
+    """
+    Verwirft alle Replik-Verbindungen, wenn die Replik-Datei ersetzt wurde.
+    Muss vor jedem Auschecken von Replik-Verbindungen aufgerufen werden (get_read_db, Warm-up),
+    sonst lesen gepoolte Verbindungen weiter die alte Datei.
+    """
+    global _engine_replica_file_id, _read_engine_generation
+    if not READ_REPLICA_PATH:
+        return
+    file_id = _replica_file_id()
+    if file_id is None:
+        return
+    with _replica_lock:
+        if file_id != _engine_replica_file_id:
+            read_engine.dispose()
+            _engine_replica_file_id = file_id
+            _read_engine_generation += 1
+
+def read_engine_generation():
+    return _read_engine_generation
+
 # Dependency
 def get_db():
     db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# Dependency for read-only endpoints
+def get_read_db():
+    refresh_read_engine()
+    db = ReadSessionLocal()
     try:
         yield db
     finally:
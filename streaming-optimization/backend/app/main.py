@@ -1,9 +1,28 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.routers.games import router as games_router
 from app.routers.offers import router as offers_router
 from app.routers.packages import router as packages_router
 from app.routers.comparison import router as comparison_router
+from app.db.database import engine, read_engine
+from app.services.warmup import is_healthy, is_ready, readiness_report, run_startup, stop_startup
+
+# Startphase: Pool, Daten und Abfragen im Hintergrund aufwärmen, Fortschritt über /ready
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_task = asyncio.create_task(asyncio.to_thread(run_startup))
+    yield
+    # Herunterfahren: Wiederholungen abbrechen, auf den laufenden Schritt warten, Verbindungen schließen
+    stop_startup()
+    try:
+        await asyncio.wait_for(startup_task, timeout=10)
+    except asyncio.TimeoutError:
+        pass
+    read_engine.dispose()
+    engine.dispose()
 
 # FastAPI-Instanz erstellen
 app = FastAPI(
@@ -11,6 +30,7 @@ app = FastAPI(
     description="API für Streaming-Pakete und Spiele",
     version="1.0.0",
     root_path="/", 
+    lifespan=lifespan,
 )
 
 # CORS-Middleware hinzufügen
@@ -25,8 +45,21 @@ app.add_middleware(
 # Router registrieren
 app.include_router(games_router, prefix="/api/games", tags=["Games"])
 app.include_router(offers_router, prefix="/api/offers", tags=["Streaming Offers"])
+app.include_router(packages_router, prefix="/api/packages", tags=["Streaming Packages"])
 app.include_router(comparison_router, prefix="/api/comparison")
 
 @app.get("/")
 def read_root():
-    return {"message": "Willkommen bei der Streaming Package Comparator API!"}
\ No newline at end of file
+    return {"message": "Willkommen bei der Streaming Package Comparator API!"}
+
+# Liveness: der Prozess läuft; nach endgültig fehlgeschlagener Startphase 503, damit neu gestartet wird
+@app.get("/health")
+def health():
+    if not is_healthy():
+        return JSONResponse(status_code=503, content={"status": "unhealthy", "error": readiness_report()["error"]})
+    return {"status": "alive"}
+
+# Readiness: erst nach abgeschlossener Startphase 200, vorher 503
+@app.get("/ready")
+def ready():
+    return JSONResponse(status_code=200 if is_ready() else 503, content=readiness_report())
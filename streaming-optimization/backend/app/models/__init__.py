@@ -1,3 +1,3 @@
-from .models import Base, Game, StreamingPackage, StreamingOffer
+from .models import Base, Game, StreamingPackage, StreamingOffer, DataVersion
 
-__all__ = ["Base", "Game", "StreamingPackage", "StreamingOffer"]
\ No newline at end of file
+__all__ = ["Base", "Game", "StreamingPackage", "StreamingOffer", "DataVersion"]
\ No newline at end of file
@@ -4,10 +4,11 @@ It includes three main tables:
 1. `Game`: Stores information about games (e.g., teams, start time, and tournament name).
 2. `StreamingPackage`: Stores information about streaming packages (e.g., name, monthly prices).
 3. `StreamingOffer`: Links games and streaming packages, indicating if live streaming or highlights are available.
+4. `DataVersion`: Stores the version (CSV hash) of the dataset loaded by `scripts/load_data.py`.
 Relationships between tables are defined to facilitate easy querying.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -48,4 +49,11 @@ class StreamingOffer(Base):
 
     # Beziehungen zu anderen Tabellen
     game = relationship("Game", back_populates="streaming_offers")
-    package = relationship("StreamingPackage", back_populates="streaming_offers")
\ No newline at end of file
+    package = relationship("StreamingPackage", back_populates="streaming_offers")
+
+# Tabelle für die Version der geladenen Daten
+class DataVersion(Base):
+    __tablename__ = "data_version"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    version = Column(String, nullable=False)
+    loaded_at = Column(DateTime, nullable=False, server_default=func.now())
\ No newline at end of file
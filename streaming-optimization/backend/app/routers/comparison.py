@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List
 from app.models import Game, StreamingOffer, StreamingPackage
-from app.db.database import get_db
+from app.db.database import get_read_db
 
 router = APIRouter()
 
@@ -11,7 +11,7 @@ def get_comparison_data(
     skip: int = 0, 
     limit: int = 1, 
     teams: List[str] = Query(None), 
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     
     if teams:
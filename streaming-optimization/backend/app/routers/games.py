@@ -3,7 +3,8 @@ This FastAPI router handles HTTP GET requests to retrieve game information from
 Key features:
 1. Filters games by optional query parameters: `team_home`, `team_away`, and `tournament_name` (case-insensitive).
 2. Implements pagination using `limit` (maximum results) and `offset` (starting point).
-3. Uses a dependency (`get_db`) to manage the database session.
+3. Uses a dependency (`get_read_db`) to manage the read-only database session.
+4. `/teams` lists all team names, served from the startup cache when it is filled.
 The response is modeled as a list of `GameSchema` objects.
 """
 
@@ -11,25 +12,18 @@ from typing import List
 from fastapi import FastAPI, APIRouter, Query, Depends
 from sqlalchemy.orm import Session
 from app.schemas.game_schema import GameSchema
-from app.db.database import SessionLocal
+from app.db.database import get_read_db
 from app.models import Game
+from app.services.data_cache import get_cache
 
 router = APIRouter()
 
-# Dependency: Datenbank-Session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/", response_model=List[GameSchema], tags=["Games"])
 def get_games(
     team_home: str = None,
     team_away: str = None,
     tournament_name: str = None, 
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     query = db.query(Game)
 
@@ -45,3 +39,17 @@ def get_games(
     return query.all()
 
 
+@router.get("/teams", response_model=List[str], tags=["Games"])
+def get_teams(db: Session = Depends(get_read_db)):
+    """
+    Liste aller Teamnamen (Heim- und Auswärtsteams), alphabetisch sortiert.
+    Gedacht für die Teamauswahl im Frontend, die Teamnamen für `teams`-Parameter von
+    `/api/packages/...` und `/api/comparison` braucht. Wird aus dem beim Start geladenen Cache bedient.
+    """
+    cache = get_cache(db)
+    if cache is not None:
+        return cache["teams"]
+
+    teams = {row[0] for row in db.query(Game.team_home).distinct()}
+    teams.update(row[0] for row in db.query(Game.team_away).distinct())
+    return sorted(teams)
@@ -3,7 +3,7 @@ This FastAPI router handles HTTP GET requests to retrieve streaming offers from
 Key features:
 1. Filters streaming offers by optional query parameters: `game_id`, `streaming_package_id`, `live`, and `highlights`.
 2. Implements pagination using `limit` (maximum results) and `offset` (starting point).
-3. Uses a dependency (`get_db`) to manage the database session.
+3. Uses a dependency (`get_read_db`) to manage the read-only database session.
 The response is modeled as a list of `StreamingOfferSchema` objects.
 """
 
@@ -11,19 +11,11 @@ from fastapi import APIRouter, Depends
 from typing import List
 from sqlalchemy.orm import Session
 from app.schemas.offer_schema import StreamingOfferSchema
-from app.db.database import SessionLocal
+from app.db.database import get_read_db
 from app.models import StreamingOffer
 
 router = APIRouter()
 
-# Dependency to get the database session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Endpoint for streaming_offers
 @router.get("/", response_model=List[StreamingOfferSchema], tags=["Streaming Offers"])
 def get_streaming_offers(
@@ -33,7 +25,7 @@ def get_streaming_offers(
     highlights: bool = None,
     limit: int = 10,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     query = db.query(StreamingOffer)
     if game_id:
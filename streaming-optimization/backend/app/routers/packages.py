@@ -6,6 +6,10 @@ Key features:
 2. `get_packages_by_teams`: Retrieves packages that stream games for specific teams.
 3. `rank_streaming_packages`: Ranks streaming packages based on the number of streamed games for specified teams.
 4. `get_optimal_package_combination`: Calculates the optimal combination of streaming packages to cover all games for a given list of teams at the minimum cost.
+5. `get_optimal_tournament_combination`: Same as above for all games of a tournament.
+
+Single-team and tournament combinations are served from the lookup table written by `scripts/precompute_combinations.py`
+if one exists for the data version stored in the database; otherwise they are solved live.
 
 Pagination is implemented where applicable, and advanced SQL queries are used for filtering, grouping, and ranking.
 """
@@ -16,19 +20,14 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.schemas.package_schema import StreamingPackageSchema
 from sqlalchemy.sql import func
-from app.db.database import SessionLocal
+from app.db.database import get_read_db
 from app.models import StreamingPackage, Game, StreamingOffer
+from app.services.combinations import solve_for_games
+from app.services.precomputed import lookup_team, lookup_tournament
 
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/", response_model=List[StreamingPackageSchema], tags=["Streaming Packages"])
 def get_streaming_packages(
     name: Optional[str] = None,
@@ -36,7 +35,7 @@ def get_streaming_packages(
     monthly_price_yearly_subscription_in_cents: Optional[int] = None,
     limit: int = 10,
     offset: int = 0, 
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Abfragen von Streaming-Paketen mit optionalen Filtern wie Name und Preis.
@@ -61,7 +60,7 @@ def get_packages_by_teams(
     teams: List[str] = Query(..., description="List of team names"), 
     limit: int = Query(10, ge=1),
     # offset: int = Query(10, ge=0),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Abfragen von Streaming-Paketen basierend auf den Teams, die gestreamt werden.
@@ -100,7 +99,7 @@ def rank_streaming_packages(
     teams: List[str] = Query(..., description="List of team names"),
     limit: int = Query(10, ge=1),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Ranking der Streaming-Pakete basierend auf der Verfügbarkeit gestreamter Spiele.
@@ -140,82 +139,36 @@ def rank_streaming_packages(
 @router.get("/optimal-combination", tags=["Streaming Packages"])
 def get_optimal_package_combination(
     teams: List[str] = Query(..., description="List of team names"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Find the smallest price combination of streaming packages to cover all games for the given teams.
+    Single-team queries are served from the precomputed lookup table when available.
     """
+    if len(teams) == 1:
+        precomputed = lookup_team(db, teams[0])
+        if precomputed is not None:
+            return precomputed
+
     # Step 1: Find all relevant games for the given teams
-    print("Teams:", teams)
     games = db.query(Game).filter(
         (Game.team_home.in_(teams)) | (Game.team_away.in_(teams))
     ).all()
-    print("Games:", games)
-    if not games:
-        return {"message": "No games found for the specified teams."}
+    return solve_for_games(games, db)
 
-    game_ids = {game.id for game in games}
 
-    # Step 2: Find all streaming offers for these games
-    offers = db.query(StreamingOffer).filter(StreamingOffer.game_id.in_(game_ids)).all()
+@router.get("/optimal-combination/tournament", tags=["Streaming Packages"])
+def get_optimal_tournament_combination(
+    tournament_name: str = Query(..., description="Name of the tournament"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Find the smallest price combination of streaming packages to cover all games of a tournament.
+    """
+    precomputed = lookup_tournament(db, tournament_name)
+    if precomputed is not None:
+        return precomputed
 
-    # Step 3: erstelle Mapping: Paket -> Spiele
-    package_to_games = {}
-    for offer in offers:
-        if offer.streaming_package_id not in package_to_games:
-            package_to_games[offer.streaming_package_id] = set()
-        package_to_games[offer.streaming_package_id].add(offer.game_id)
+    games = db.query(Game).filter(Game.tournament_name == tournament_name).all()
+    return solve_for_games(games, db)
 
-    # Step 4: Paketpreise abrufen
-    packages = db.query(StreamingPackage).filter(
-        StreamingPackage.id.in_(package_to_games.keys())
-    ).all()
-    package_prices = {pkg.id: pkg.monthly_price_cents for pkg in packages}
-
-    print("Package Prices:", package_prices)
-
-    # Step 5: Kostenfreie Pakete berücksichtigen
-    selected_packages = []
-    covered_games = set()
-
-    for package_id, price in package_prices.items():
-        if price == 0 and (package_to_games[package_id] - covered_games):
-            selected_packages.append({"id": package_id, "price_cents": price})
-            covered_games.update(package_to_games[package_id])
-
-    # Step 6: Kostenpflichtige Pakete hinzufügen, wenn nötig
-    while covered_games != game_ids:
-        # Find the package that covers the most uncovered games for the lowest price
-        best_package = None
-        best_value = 0  # Value = games covered / price
-        for package_id, games in package_to_games.items():
-            if package_id in [pkg["id"] for pkg in selected_packages]:
-                continue  # Berets ausgewählte Pakete überspringen
-
-            uncovered_games = games - covered_games
-            if uncovered_games and package_prices[package_id] > 0:  # Exclude free packages here
-                value = len(uncovered_games) / package_prices[package_id]
-                if value > best_value:
-                    best_value = value
-                    best_package = package_id
-
-        if not best_package:
-            return {"message": "Cannot cover all games with available packages."}
-
-        # Package hinzufügen
-        selected_packages.append(
-            {"id": best_package, "price_cents": package_prices[best_package]}
-        )
-        covered_games.update(package_to_games[best_package])
-
-    print("Teams:", teams)
-    print("Game IDs:", [game.id for game in games])
-    print("Package Prices:", package_prices)
-    print("Package to Games Mapping:", package_to_games)
-
-    # Step 7: Gesamtpreis berechnen
-    total_price = sum(pkg["price_cents"] for pkg in selected_packages)
-    return {
-        "selected_packages": selected_packages,
-        "total_price_cents": total_price,
-    }
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+This module solves the optimal package combination for a set of games against the loaded data.
+It is used by the `/optimal-combination` endpoints for queries without a precomputed answer and by the
+startup warm-up (`app/services/warmup.py`). Offers and prices come from the startup cache
+(`app/services/data_cache.py`) when it is filled, otherwise from the read database; both paths iterate
+games and packages in the same order as `scripts/precompute_combinations.py`.
+"""
+
+from typing import List
+from sqlalchemy.orm import Session
+from app.models import Game, StreamingOffer, StreamingPackage
+from app.services.data_cache import get_cache
+from app.services.optimizer import build_package_to_games, offers_for_games, solve_optimal_combination
+
+
+def solve_for_games(games: List[Game], db: Session) -> dict:
+    """
+    Löst die optimale Paketkombination für `games` live.
+    Angebote und Preise kommen aus dem Startup-Cache, sonst aus der Datenbank.
+    """
+    if not games:
+        return {"message": "No games found for the specified teams."}
+
+    game_ids = {game.id for game in games}
+    cache = get_cache(db)
+
+    if cache is not None:
+        # Step 2-4: Angebote und Preise aus dem beim Start geladenen Cache
+        package_to_games = build_package_to_games(offers_for_games(cache["offers_by_game"], game_ids))
+        package_prices = {
+            package_id: price
+            for package_id, price in cache["package_prices"].items()
+            if package_id in package_to_games
+        }
+    else:
+        # Step 2: Find all streaming offers for these games
+        offers = (
+            db.query(StreamingOffer)
+            .filter(StreamingOffer.game_id.in_(game_ids))
+            .order_by(StreamingOffer.game_id, StreamingOffer.id)
+            .all()
+        )
+
+        # Step 3: erstelle Mapping: Paket -> Spiele
+        package_to_games = build_package_to_games(
+            (offer.game_id, offer.streaming_package_id) for offer in offers
+        )
+
+        # Step 4: Paketpreise abrufen
+        packages = db.query(StreamingPackage).filter(
+            StreamingPackage.id.in_(package_to_games.keys())
+        ).order_by(StreamingPackage.id).all()
+        package_prices = {pkg.id: pkg.monthly_price_cents for pkg in packages}
+
+    # Step 5: Kombination berechnen (kostenfreie Pakete zuerst, dann greedy)
+    return solve_optimal_combination(game_ids, package_to_games, package_prices)
@@ -0,0 +1,72 @@
+"""
+This module holds read-mostly data preloaded into memory at startup (see `app/services/warmup.py`):
+package prices, the list of all teams and the streaming offers indexed by game.
+The cache is tagged with the data version stored by `scripts/load_data.py`. `get_cache` compares it with
+the cached version from `app/services/data_version.py` (no query per request) and rebuilds the cache after
+a reload, so it never pins old data.
+Until it is filled, `get_cache` returns `None` and callers query the database instead.
+"""
+
+import threading
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.models import Game, StreamingOffer, StreamingPackage
+from app.services.data_version import cached_data_version, current_data_version
+
+_lock = threading.Lock()
+_rebuild_lock = threading.Lock()
+_cache = None
+
+
+def preload(db: Session) -> dict:
+    """Lädt Paketpreise, Teams und Angebote aus der Datenbank in den Speicher."""
+    global _cache
+
+    version = current_data_version(db)
+    packages = db.query(StreamingPackage.id, StreamingPackage.monthly_price_cents).order_by(StreamingPackage.id).all()
+    offers = (
+        db.query(StreamingOffer.game_id, StreamingOffer.streaming_package_id)
+        .order_by(StreamingOffer.game_id, StreamingOffer.id)
+        .all()
+    )
+    teams = {row[0] for row in db.query(Game.team_home).distinct()}
+    teams.update(row[0] for row in db.query(Game.team_away).distinct())
+
+    # Index Spiel -> Pakete, damit pro Anfrage nur die angefragten Spiele nachgeschlagen werden
+    offers_by_game = {}
+    for game_id, package_id in offers:
+        offers_by_game.setdefault(game_id, []).append(package_id)
+
+    # Neues Dict komplett aufbauen und erst dann zuweisen, damit Leser nie einen halben Cache sehen
+    cache = {
+        "data_version": version,
+        "package_prices": {package_id: price for package_id, price in packages},
+        "teams": sorted(teams),
+        "offers_by_game": offers_by_game,
+    }
+    with _lock:
+        _cache = cache
+    return cache
+
+
+def get_cache(db: Session) -> Optional[dict]:
+    """
+    Gibt den Cache zurück. Hat sich die Datenversion geändert, baut genau ein Thread ihn neu auf;
+    alle anderen liefern solange weiter den bisherigen Cache.
+    """
+    cache = _cache
+    if cache is None:
+        return None
+    version = cached_data_version(db)
+    if cache["data_version"] == version:
+        return cache
+
+    if not _rebuild_lock.acquire(blocking=False):
+        return cache
+    try:
+        # Erneut prüfen: ein anderer Thread kann den Cache inzwischen neu aufgebaut haben
+        if _cache["data_version"] == version:
+            return _cache
+        return preload(db)
+    finally:
+        _rebuild_lock.release()
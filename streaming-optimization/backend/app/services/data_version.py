@@ -0,0 +1,74 @@
+"""
+This module identifies which dataset is loaded.
+`scripts/load_data.py` computes the version as a hash over the CSV files it loads and stores it in the
+`data_version` table of PostgreSQL and of the read replica. The API reads it back from the database it
+actually queries, so precomputed results and caches are always keyed by the data being served, not by
+whatever CSVs currently sit on disk.
+`cached_data_version` keeps the version in memory, so request paths do not pay a database round trip for it.
+It is re-read after a replica swap and otherwise at most every `DATA_VERSION_TTL` seconds.
+"""
+
+import hashlib
+import os
+import time
+from typing import Optional
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.db.database import read_engine_generation
+from app.models import DataVersion
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+DATA_DIR = os.getenv("STREAMING_DATA_DIR", os.path.join(BASE_DIR, "../../data"))
+
+DATA_FILES = ("bc_game.csv", "bc_streaming_package.csv", "bc_streaming_offer.csv")
+
+DATA_VERSION_TTL = float(os.getenv("DATA_VERSION_TTL", 5.0))  # Sekunden
+
+_cached = {"version": None, "generation": None, "checked_at": None}
+
+
+def csv_data_version(data_dir: str = DATA_DIR) -> Optional[str]:
+    """Berechnet die Datenversion als SHA-256 über die CSV-Dateien (None, wenn eine Datei fehlt)."""
+    digest = hashlib.sha256()
+    for file_name in DATA_FILES:
+        path = os.path.join(data_dir, file_name)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def current_data_version(db: Session) -> Optional[str]:
+    """Liest die Version der geladenen Daten aus der Datenbank (None, wenn keine gespeichert ist)."""
+    try:
+        row = db.query(DataVersion.version).order_by(DataVersion.id.desc()).first()
+    except SQLAlchemyError:
+        # z.B. Tabelle fehlt, weil load_data.py noch nicht gelaufen ist
+        db.rollback()
+        return None
+    return row[0] if row else None
+
+
+def cached_data_version(db: Session) -> Optional[str]:
+    """Wie `current_data_version`, aber aus dem Speicher, solange die Replik nicht getauscht und die TTL nicht abgelaufen ist."""
+    global _cached
+    cached = _cached
+    generation = read_engine_generation()
+    if (
+        cached["generation"] == generation
+        and cached["checked_at"] is not None
+        and time.monotonic() - cached["checked_at"] < DATA_VERSION_TTL
+    ):
+        return cached["version"]
+
+    version = current_data_version(db)
+    _cached = {"version": version, "generation": generation, "checked_at": time.monotonic()}
+    return version
+
+
+def record_data_version(db: Session, version: str):
+    """Speichert die Version der gerade geladenen Daten."""
+    db.query(DataVersion).delete()
+    db.add(DataVersion(version=version))
+    db.commit()
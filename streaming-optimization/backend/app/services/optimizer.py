@@ -0,0 +1,83 @@
+"""
+This module contains the greedy set-cover solver behind the optimal package combination.
+It works on plain Python structures (game ids, package -> games mapping, package prices) so it can be
+used both by the live `/optimal-combination` endpoint and by the offline precomputation script
+(`scripts/precompute_combinations.py`) without a database session.
+"""
+
+from typing import Dict, Iterable, List, Set
+
+
+def solve_optimal_combination(
+    game_ids: Set[int],
+    package_to_games: Dict[int, Set[int]],
+    package_prices: Dict[int, int],
+) -> dict:
+    """
+    Find the smallest price combination of streaming packages covering all `game_ids`.
+    Returns the same payload as the `/optimal-combination` endpoint.
+    """
+    if not game_ids:
+        return {"message": "No games found for the specified teams."}
+
+    # Kostenfreie Pakete berücksichtigen
+    selected_packages = []
+    covered_games = set()
+
+    for package_id, price in package_prices.items():
+        if price == 0 and (package_to_games[package_id] - covered_games):
+            selected_packages.append({"id": package_id, "price_cents": price})
+            covered_games.update(package_to_games[package_id])
+
+    # Kostenpflichtige Pakete hinzufügen, wenn nötig
+    while covered_games != game_ids:
+        # Find the package that covers the most uncovered games for the lowest price
+        best_package = None
+        best_value = 0  # Value = games covered / price
+        for package_id, games in package_to_games.items():
+            if package_id in [pkg["id"] for pkg in selected_packages]:
+                continue  # Bereits ausgewählte Pakete überspringen
+
+            uncovered_games = games - covered_games
+            if uncovered_games and package_prices[package_id] > 0:  # Exclude free packages here
+                value = len(uncovered_games) / package_prices[package_id]
+                if value > best_value:
+                    best_value = value
+                    best_package = package_id
+
+        if not best_package:
+            return {"message": "Cannot cover all games with available packages."}
+
+        # Package hinzufügen
+        selected_packages.append(
+            {"id": best_package, "price_cents": package_prices[best_package]}
+        )
+        covered_games.update(package_to_games[best_package])
+
+    # Gesamtpreis berechnen
+    total_price = sum(pkg["price_cents"] for pkg in selected_packages)
+    return {
+        "selected_packages": selected_packages,
+        "total_price_cents": total_price,
+    }
+
+
+def build_package_to_games(offers: Iterable) -> Dict[int, Set[int]]:
+    """Erstellt das Mapping Paket -> Spiele aus (game_id, streaming_package_id)-Paaren."""
+    package_to_games = {}
+    for game_id, package_id in offers:
+        if package_id not in package_to_games:
+            package_to_games[package_id] = set()
+        package_to_games[package_id].add(game_id)
+    return package_to_games
+
+
+def offers_for_games(offers_by_game: Dict[int, List[int]], game_ids: Set[int]):
+    """
+    Liefert (game_id, streaming_package_id)-Paare für `game_ids` aus dem Index Spiel -> Pakete.
+    Spiele werden aufsteigend durchlaufen, damit Live-Lösung und Vorberechnung bei Preisgleichstand
+    dieselben Pakete wählen.
+    """
+    for game_id in sorted(game_ids):
+        for package_id in offers_by_game.get(game_id, ()):
+            yield game_id, package_id
@@ -0,0 +1,65 @@
+"""
+This module serves precomputed optimal package combinations written by `scripts/precompute_combinations.py`.
+Results are stored per data version (see `app/services/data_version.py`). Every lookup uses the (cached)
+version of the data currently loaded in the database, so a table is only served for the dataset it was
+computed from. A loaded table is answered from memory; its file is re-checked at most every `DATA_VERSION_TTL`
+seconds and reloaded when it changed. A missing file is never cached. Without a matching file every lookup returns `None` and the
+caller falls back to solving live.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.services.data_version import DATA_DIR, DATA_VERSION_TTL, cached_data_version
+
+PRECOMPUTED_DIR = os.path.join(DATA_DIR, "precomputed")
+
+_lock = threading.Lock()
+_loaded = {"key": None, "table": {}, "checked_at": None}
+
+
+def precomputed_path(version: str, output_dir: Optional[str] = None) -> str:
+    return os.path.join(output_dir or PRECOMPUTED_DIR, f"combinations_{version}.json")
+
+
+def load_precomputed(version: Optional[str]) -> dict:
+    """Lädt die Lookup-Tabelle für `version` (leer, wenn keine vorhanden ist)."""
+    if version is None:
+        return {}
+    path = precomputed_path(version)
+
+    # Geladene Tabelle ohne Dateizugriff liefern; die Datei wird höchstens alle DATA_VERSION_TTL Sekunden geprüft
+    with _lock:
+        key, checked_at = _loaded["key"], _loaded["checked_at"]
+        if key is not None and key[:2] == (version, path) and time.monotonic() - checked_at < DATA_VERSION_TTL:
+            return _loaded["table"]
+
+    try:
+        key = (version, path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return {}
+
+    with _lock:
+        if _loaded["key"] == key:
+            _loaded["checked_at"] = time.monotonic()
+            return _loaded["table"]
+
+    with open(path, encoding="utf-8") as f:
+        table = json.load(f)
+    if table.get("data_version") != version:
+        return {}
+
+    with _lock:
+        _loaded.update(key=key, table=table, checked_at=time.monotonic())
+    return table
+
+
+def lookup_team(db: Session, team: str) -> Optional[dict]:
+    return load_precomputed(cached_data_version(db)).get("teams", {}).get(team)
+
+
+def lookup_tournament(db: Session, tournament_name: str) -> Optional[dict]:
+    return load_precomputed(cached_data_version(db)).get("tournaments", {}).get(tournament_name)
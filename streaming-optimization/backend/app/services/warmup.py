@@ -0,0 +1,211 @@
+"""
+This module runs the startup phase of the API (triggered from the lifespan handler in `app/main.py`):
+1. Opens and pre-pings the connection pool of the read engine.
+2. Loads the precomputed combination table for the data version stored in the database.
+3. Preloads package prices, teams and offers into `app/services/data_cache.py`.
+4. Runs representative optimizer, ranking and comparison queries through the service functions and plain
+   queries (no router imports) to warm query plans and caches.
+Progress and per-step timings are reported through `readiness_report`, which backs the `/ready` endpoint.
+A failing step (e.g. PostgreSQL not yet reachable while the pod boots) is retried with exponential backoff.
+Once `STARTUP_MAX_ATTEMPTS` is exhausted the startup is marked `failed` and `/health` reports unhealthy,
+so the orchestrator restarts the instance instead of keeping it alive but never ready.
+"""
+
+import os
+import threading
+import time
+from sqlalchemy import text
+from sqlalchemy.sql import func
+from app.db.database import ReadSessionLocal, read_engine, refresh_read_engine
+from app.models import Game, StreamingOffer, StreamingPackage
+from app.services.combinations import solve_for_games
+from app.services.data_cache import preload
+from app.services.data_version import current_data_version
+from app.services.precomputed import load_precomputed, lookup_team
+
+STARTUP_MAX_ATTEMPTS = int(os.getenv("STARTUP_MAX_ATTEMPTS", 5))
+STARTUP_RETRY_DELAY = float(os.getenv("STARTUP_RETRY_DELAY", 1.0))  # Sekunden, verdoppelt sich pro Versuch
+STARTUP_RETRY_MAX_DELAY = 30.0
+
+_lock = threading.Lock()
+_stop = threading.Event()
+_state = {"status": "starting", "current_step": None, "steps": [], "error": None, "duration_ms": None}
+
+
+class StartupStopped(Exception):
+    """Die Startphase wurde beim Herunterfahren abgebrochen."""
+
+
+def _record(name: str, attempt: int, started: float, error: str = None):
+    with _lock:
+        _state["steps"].append({
+            "name": name,
+            "attempt": attempt,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "ok": error is None,
+        })
+        _state["current_step"] = None
+        if error is not None:
+            _state["error"] = f"{name}: {error}"
+
+
+def _run_step(name: str, step):
+    """Führt einen Schritt aus und wiederholt ihn bei Fehlern mit exponentiellem Backoff."""
+    delay = STARTUP_RETRY_DELAY
+    for attempt in range(1, STARTUP_MAX_ATTEMPTS + 1):
+        if _stop.is_set():
+            raise StartupStopped()
+        with _lock:
+            _state["current_step"] = name
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            _record(name, attempt, started, str(e))
+            if attempt == STARTUP_MAX_ATTEMPTS:
+                raise
+            # Unterbrechbar warten, damit das Herunterfahren nicht blockiert
+            if _stop.wait(delay):
+                raise StartupStopped()
+            delay = min(delay * 2, STARTUP_RETRY_MAX_DELAY)
+        else:
+            _record(name, attempt, started)
+            return
+
+
+def _read_session():
+    # Wie get_read_db: erst eine ausgetauschte Replik erkennen, dann Verbindungen auschecken
+    refresh_read_engine()
+    return ReadSessionLocal()
+
+
+def _warm_pool():
+    refresh_read_engine()
+    # So viele Verbindungen gleichzeitig öffnen, wie der Pool hält, damit keine Anfrage kalt verbindet
+    pool_size = getattr(read_engine.pool, "size", lambda: 1)()
+    connections = [read_engine.connect() for _ in range(pool_size)]
+    try:
+        for connection in connections:
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def _load_precomputed():
+    db = _read_session()
+    try:
+        load_precomputed(current_data_version(db))
+    finally:
+        db.close()
+
+
+def _preload_data():
+    db = _read_session()
+    try:
+        preload(db)
+    finally:
+        db.close()
+
+
+def _representative_teams(db, count: int = 2):
+    teams = [team.strip() for team in os.getenv("WARMUP_TEAMS", "").split(",") if team.strip()]
+    if teams:
+        return teams
+    rows = (
+        db.query(Game.team_home, func.count(Game.id))
+        .group_by(Game.team_home)
+        .order_by(func.count(Game.id).desc())
+        .limit(count)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
+def _warm_queries():
+    db = _read_session()
+    try:
+        teams = _representative_teams(db)
+        tournament = db.query(Game.tournament_name).first()
+        if not teams or tournament is None:
+            return  # Keine Daten geladen
+
+        # Optimizer: vorberechnete Antwort sowie Live-Lösung für mehrere Teams und ein Turnier
+        lookup_team(db, teams[0])
+        team_games = db.query(Game).filter(
+            (Game.team_home.in_(teams)) | (Game.team_away.in_(teams))
+        ).all()
+        solve_for_games(team_games, db)
+        solve_for_games(db.query(Game).filter(Game.tournament_name == tournament[0]).all(), db)
+
+        # Ranking: dieselbe Aggregation wie /api/packages/ranked
+        (
+            db.query(StreamingPackage.id, func.count(StreamingOffer.game_id))
+            .join(StreamingOffer, StreamingOffer.streaming_package_id == StreamingPackage.id)
+            .join(Game, StreamingOffer.game_id == Game.id)
+            .filter((Game.team_home.in_(teams)) | (Game.team_away.in_(teams)))
+            .group_by(StreamingPackage.id)
+            .order_by(func.count(StreamingOffer.game_id).desc())
+            .limit(10)
+            .all()
+        )
+
+        # Vergleich: Turnierliste und Angebotsabfrage pro Spiel und Paket wie /api/comparison
+        db.query(Game.tournament_name).distinct().limit(1).all()
+        for package in db.query(StreamingPackage).all():
+            db.query(StreamingOffer).filter(
+                StreamingOffer.game_id == team_games[0].id,
+                StreamingOffer.streaming_package_id == package.id,
+            ).first()
+    finally:
+        db.close()
+
+
+STARTUP_STEPS = [
+    ("connection_pool", _warm_pool),
+    ("precomputed_combinations", _load_precomputed),
+    ("preload_data", _preload_data),
+    ("warmup_queries", _warm_queries),
+]
+
+
+def run_startup():
+    """Führt alle Startschritte nacheinander aus; bricht ab, wenn ein Schritt endgültig fehlschlägt."""
+    _stop.clear()
+    with _lock:
+        _state.update(status="starting", current_step=None, steps=[], error=None, duration_ms=None)
+
+    started = time.perf_counter()
+    try:
+        for name, step in STARTUP_STEPS:
+            _run_step(name, step)
+    except StartupStopped:
+        status = "stopped"
+    except Exception:
+        status = "failed"
+    else:
+        status = "ready"
+    with _lock:
+        _state["status"] = status
+        _state["current_step"] = None
+        if status == "ready":
+            _state["error"] = None
+        _state["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def stop_startup():
+    """Bricht laufende Wiederholungen ab (beim Herunterfahren)."""
+    _stop.set()
+
+
+def is_ready() -> bool:
+    return _state["status"] == "ready"
+
+
+def is_healthy() -> bool:
+    return _state["status"] != "failed"
+
+
+def readiness_report() -> dict:
+    with _lock:
+        return {**_state, "steps": list(_state["steps"])}
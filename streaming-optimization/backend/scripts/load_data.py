@@ -1,13 +1,16 @@
+import argparse
 import os
 import sys
 import pandas as pd
 import numpy as np
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker # type: ignore
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.db.database import engine
-from app.models import Game, StreamingOffer, StreamingPackage
+from app.db.database import engine, READ_REPLICA_PATH
+from app.models import Base, DataVersion, Game, StreamingOffer, StreamingPackage
+from app.services.data_version import csv_data_version, record_data_version
 
 # Absoluter Pfad zur CSV-Datei
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -26,7 +29,7 @@ def load_games(db: Session, csv_path: str):
             team_home=row['team_home'],
             team_away=row['team_away'],
             tournament_name=row['tournament_name'],
-            starts_at=row['starts_at']  # Verwenden Sie 'starts_at' anstelle von 'date'
+            starts_at=pd.to_datetime(row['starts_at']).to_pydatetime()  # Verwenden Sie 'starts_at' anstelle von 'date'
         )
         db.add(game)
     db.commit()
@@ -65,20 +68,79 @@ def load_streaming_offers(db: Session, csv_path: str):
     print("Streaming-Angebote erfolgreich geladen.")
 
 
+# Indizes für die Lesezugriffe der Vergleichs-, Ranking- und Kombinationsabfragen
+REPLICA_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_games_team_home ON games (team_home)",
+    "CREATE INDEX IF NOT EXISTS ix_games_team_away ON games (team_away)",
+    "CREATE INDEX IF NOT EXISTS ix_games_tournament_name ON games (tournament_name)",
+    "CREATE INDEX IF NOT EXISTS ix_offers_game_package ON streaming_offers (game_id, streaming_package_id)",
+    "CREATE INDEX IF NOT EXISTS ix_offers_package ON streaming_offers (streaming_package_id)",
+]
+
+def build_replica(replica_path: str, games_csv: str, packages_csv: str, offers_csv: str, version: str):
+    """Baut die eingebettete SQLite-Lesereplik aus denselben CSV-Dateien."""
+    replica_path = os.path.abspath(replica_path)
+    os.makedirs(os.path.dirname(replica_path), exist_ok=True)
+    tmp_path = f"{replica_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    replica_engine = create_engine(f"sqlite:///{tmp_path}")
+    Base.metadata.create_all(bind=replica_engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)()
+    try:
+        load_games(session, games_csv)
+        load_streaming_packages(session, packages_csv)
+        load_streaming_offers(session, offers_csv)
+        record_data_version(session, version)
+    finally:
+        session.close()
+
+    with replica_engine.begin() as connection:
+        for statement in REPLICA_INDEXES:
+            connection.execute(text(statement))
+        connection.execute(text("ANALYZE"))
+    replica_engine.dispose()
+
+    # Atomar ersetzen, damit laufende Instanzen nie eine halbe Replik lesen
+    os.replace(tmp_path, replica_path)
+    print(f"Lesereplik erfolgreich erstellt: {replica_path}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Lädt die CSV-Daten in die Datenbank.")
+    parser.add_argument("--replica", default=READ_REPLICA_PATH, help="Pfad der SQLite-Lesereplik (Standard: READ_REPLICA_PATH)")
+    parser.add_argument("--replica-only", action="store_true", help="Nur die Lesereplik bauen, PostgreSQL nicht anfassen")
+    args = parser.parse_args()
+
     # Beispielpfade zu den CSV-Dateien
     games_csv = os.path.join(DATA_DIR, "bc_game.csv")
     packages_csv = os.path.join(DATA_DIR, "bc_streaming_package.csv")
     offers_csv = os.path.join(DATA_DIR, "bc_streaming_offer.csv")
 
-    # Datenbankverbindung herstellen
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
+    version = csv_data_version(DATA_DIR)
+
+    if args.replica_only and not args.replica:
+        parser.error("--replica-only benötigt --replica oder READ_REPLICA_PATH")
+
+    if not args.replica_only:
+        # Datenbankverbindung herstellen
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        session = SessionLocal()
+
+        # Daten laden
+        load_games(session, games_csv)
+        load_streaming_packages(session, packages_csv)
+        load_streaming_offers(session, offers_csv)
+
+        # Datenversion speichern, damit die API vorberechnete Ergebnisse zuordnen kann
+        DataVersion.__table__.create(bind=engine, checkfirst=True)
+        record_data_version(session, version)
+        session.close()
+        print(f"Datenversion {version} gespeichert.")
 
-    # Daten laden
-    load_games(session, games_csv)
-    load_streaming_packages(session, packages_csv)
-    load_streaming_offers(session, offers_csv)
+    if args.replica:
+        build_replica(args.replica, games_csv, packages_csv, offers_csv, version)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
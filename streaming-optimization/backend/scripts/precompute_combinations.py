@@ -0,0 +1,119 @@
+"""
+Offline-Vorberechnung der optimalen Paketkombinationen.
+
+Liest die CSV-Dateien aus `data/` einmal ein und berechnet die optimale Paketkombination
+für jedes Team und jedes Turnier (`tournament_name`) parallel auf allen CPU-Kernen.
+Das Ergebnis wird als `data/precomputed/combinations_<data_version>.json` geschrieben und
+von `/api/packages/optimal-combination` direkt ausgeliefert, sobald `scripts/load_data.py`
+dieselben CSV-Dateien (gleiche Datenversion) in die Datenbank geladen hat.
+
+Aufruf:
+    python scripts/precompute_combinations.py [--workers N] [--data-dir PATH] [--output-dir PATH]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.optimizer import build_package_to_games, offers_for_games, solve_optimal_combination
+from app.services.data_version import DATA_DIR, csv_data_version
+from app.services.precomputed import precomputed_path
+
+# Werden pro Worker-Prozess einmal gesetzt (siehe _init_worker)
+_OFFERS_BY_GAME = {}
+_PACKAGE_PRICES = {}
+
+
+def read_data(data_dir: str):
+    """Liest Spiele, Pakete und Angebote aus den CSV-Dateien (Preise wie in load_data.py)."""
+    games_df = pd.read_csv(os.path.join(data_dir, "bc_game.csv"))
+    packages_df = pd.read_csv(os.path.join(data_dir, "bc_streaming_package.csv"))
+    offers_df = pd.read_csv(os.path.join(data_dir, "bc_streaming_offer.csv"))
+
+    package_prices = {
+        int(row['id']): int(row['monthly_price_cents']) if not pd.isna(row['monthly_price_cents']) else 0
+        for _, row in packages_df.sort_values('id').iterrows()
+    }
+    # Index Spiel -> Pakete in Ladereihenfolge (entspricht der Angebots-ID in der Datenbank)
+    offers_by_game = {}
+    for game_id, package_id in zip(offers_df['game_id'], offers_df['streaming_package_id']):
+        offers_by_game.setdefault(int(game_id), []).append(int(package_id))
+
+    # Spiele pro Team und pro Turnier sammeln
+    team_games = {}
+    tournament_games = {}
+    for game_id, team_home, team_away, tournament_name in zip(
+        games_df['id'], games_df['team_home'], games_df['team_away'], games_df['tournament_name']
+    ):
+        for team in (team_home, team_away):
+            team_games.setdefault(team, set()).add(int(game_id))
+        tournament_games.setdefault(tournament_name, set()).add(int(game_id))
+
+    return team_games, tournament_games, offers_by_game, package_prices
+
+
+def _init_worker(offers_by_game, package_prices):
+    global _OFFERS_BY_GAME, _PACKAGE_PRICES
+    _OFFERS_BY_GAME = offers_by_game
+    _PACKAGE_PRICES = package_prices
+
+
+def _solve(game_ids):
+    # Gleiche Reihenfolge wie im Live-Endpunkt: Spiele aufsteigend, Pakete nach ID
+    package_to_games = build_package_to_games(offers_for_games(_OFFERS_BY_GAME, game_ids))
+    package_prices = {
+        package_id: price for package_id, price in _PACKAGE_PRICES.items() if package_id in package_to_games
+    }
+    return solve_optimal_combination(game_ids, package_to_games, package_prices)
+
+
+def precompute(data_dir: str, workers: int = None) -> dict:
+    team_games, tournament_games, offers_by_game, package_prices = read_data(data_dir)
+    keys = [("teams", team) for team in team_games] + [("tournaments", name) for name in tournament_games]
+    game_sets = [team_games[key] if kind == "teams" else tournament_games[key] for kind, key in keys]
+
+    table = {"data_version": csv_data_version(data_dir), "teams": {}, "tournaments": {}}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(offers_by_game, package_prices)
+    ) as executor:
+        chunksize = max(1, len(game_sets) // ((workers or os.cpu_count() or 1) * 4))
+        for (kind, key), result in zip(keys, executor.map(_solve, game_sets, chunksize=chunksize)):
+            table[kind][key] = result
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimale Paketkombinationen vorberechnen.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Verzeichnis mit den CSV-Dateien")
+    parser.add_argument("--output-dir", default=None, help="Zielverzeichnis (Standard: <data-dir>/precomputed)")
+    parser.add_argument("--workers", type=int, default=None, help="Anzahl Prozesse (Standard: alle Kerne)")
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or os.path.join(args.data_dir, "precomputed")
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    table = precompute(args.data_dir, args.workers)
+    path = precomputed_path(table["data_version"], output_dir)
+
+    # Atomar schreiben, damit die API nie eine halbe Datei liest
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+    print(
+        f"{len(table['teams'])} Teams und {len(table['tournaments'])} Turniere "
+        f"in {time.perf_counter() - start:.1f}s berechnet: {path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
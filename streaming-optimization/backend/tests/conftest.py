@@ -0,0 +1,44 @@
+"""
+Gemeinsame Fixtures für die pytest-Tests.
+Die Tests laufen ohne externe Dienste: die API liest aus einer SQLite-Lesereplik,
+die einmal pro Testlauf mit `build_replica` aus den CSV-Dateien in `data/` gebaut wird.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+# READ_REPLICA_PATH muss gesetzt sein, bevor app.db.database importiert wird
+_TMP_DIR = tempfile.mkdtemp(prefix="streaming-tests-")
+os.environ["READ_REPLICA_PATH"] = os.path.join(_TMP_DIR, "replica.sqlite")
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# test_db.py ist ein manuelles Verbindungsskript gegen PostgreSQL, kein pytest-Test
+collect_ignore = ["test_db.py"]
+
+
+@pytest.fixture(scope="session")
+def replica():
+    from scripts.load_data import DATA_DIR, build_replica
+    from app.services.data_version import csv_data_version
+
+    build_replica(
+        os.environ["READ_REPLICA_PATH"],
+        os.path.join(DATA_DIR, "bc_game.csv"),
+        os.path.join(DATA_DIR, "bc_streaming_package.csv"),
+        os.path.join(DATA_DIR, "bc_streaming_offer.csv"),
+        csv_data_version(DATA_DIR),
+    )
+    return os.environ["READ_REPLICA_PATH"]
+
+
+@pytest.fixture
+def db(replica):
+    from app.db.database import get_read_db
+
+    sessions = get_read_db()
+    yield next(sessions)
+    sessions.close()
@@ -0,0 +1,53 @@
+import threading
+import time
+
+from app.services import data_cache
+
+
+def test_rebuild_runs_once_while_old_cache_is_served(monkeypatch):
+    old_cache = {"data_version": "old"}
+    new_cache = {"data_version": "new"}
+    rebuilds = []
+    rebuild_started = threading.Event()
+    release = threading.Event()
+
+    def slow_preload(db):
+        rebuilds.append(1)
+        rebuild_started.set()
+        release.wait(5)
+        data_cache._cache = new_cache
+        return new_cache
+
+    monkeypatch.setattr(data_cache, "_cache", old_cache)
+    monkeypatch.setattr(data_cache, "cached_data_version", lambda db: "new")
+    monkeypatch.setattr(data_cache, "preload", slow_preload)
+
+    results = []
+    rebuilding = threading.Thread(target=lambda: results.append(data_cache.get_cache(None)))
+    rebuilding.start()
+    assert rebuild_started.wait(5)
+
+    # Während des Neuaufbaus liefern andere Anfragen sofort den alten Cache
+    started = time.monotonic()
+    others = [data_cache.get_cache(None) for _ in range(5)]
+    assert time.monotonic() - started < 1
+    assert all(cache is old_cache for cache in others)
+
+    release.set()
+    rebuilding.join(5)
+
+    assert results == [new_cache]
+    assert data_cache.get_cache(None) is new_cache
+    assert len(rebuilds) == 1
+
+
+def test_unchanged_version_returns_cache(monkeypatch):
+    def unexpected_preload(db):
+        raise AssertionError("Cache darf nicht neu aufgebaut werden")
+
+    cache = {"data_version": "v1"}
+    monkeypatch.setattr(data_cache, "_cache", cache)
+    monkeypatch.setattr(data_cache, "cached_data_version", lambda db: "v1")
+    monkeypatch.setattr(data_cache, "preload", unexpected_preload)
+
+    assert data_cache.get_cache(None) is cache
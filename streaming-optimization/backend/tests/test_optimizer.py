@@ -0,0 +1,55 @@
+from app.services.optimizer import build_package_to_games, offers_for_games, solve_optimal_combination
+
+
+def test_no_games():
+    assert solve_optimal_combination(set(), {}, {}) == {"message": "No games found for the specified teams."}
+
+
+def test_free_packages_are_taken_first():
+    package_to_games = {1: {10, 11}, 2: {10, 11, 12}, 3: {12}}
+    package_prices = {1: 0, 2: 500, 3: 100}
+
+    result = solve_optimal_combination({10, 11, 12}, package_to_games, package_prices)
+
+    assert result == {
+        "selected_packages": [{"id": 1, "price_cents": 0}, {"id": 3, "price_cents": 100}],
+        "total_price_cents": 100,
+    }
+
+
+def test_free_package_without_new_games_is_skipped():
+    package_to_games = {1: {10}, 2: {10}}
+    package_prices = {1: 0, 2: 0}
+
+    result = solve_optimal_combination({10}, package_to_games, package_prices)
+
+    assert result["selected_packages"] == [{"id": 1, "price_cents": 0}]
+    assert result["total_price_cents"] == 0
+
+
+def test_paid_packages_by_games_per_price():
+    package_to_games = {1: {10, 11, 12}, 2: {10}, 3: {11}, 4: {12}}
+    package_prices = {1: 900, 2: 200, 3: 200, 4: 200}
+
+    result = solve_optimal_combination({10, 11, 12}, package_to_games, package_prices)
+
+    assert [pkg["id"] for pkg in result["selected_packages"]] == [2, 3, 4]
+    assert result["total_price_cents"] == 600
+
+
+def test_cannot_cover_all_games():
+    package_to_games = {1: {10}}
+    package_prices = {1: 100}
+
+    result = solve_optimal_combination({10, 11}, package_to_games, package_prices)
+
+    assert result == {"message": "Cannot cover all games with available packages."}
+
+
+def test_offers_for_games_uses_ascending_game_order():
+    offers_by_game = {3: [7], 1: [5, 6], 2: [8]}
+
+    offers = list(offers_for_games(offers_by_game, {3, 1, 4}))
+
+    assert offers == [(1, 5), (1, 6), (3, 7)]
+    assert build_package_to_games(offers) == {5: {1}, 6: {1}, 7: {3}}
@@ -0,0 +1,95 @@
+import json
+import os
+
+import pytest
+from sqlalchemy import event
+
+from app.db.database import read_engine
+from app.models import Game
+from app.services.combinations import solve_for_games
+from app.services import data_cache, precomputed
+from app.services.data_version import current_data_version
+
+
+@pytest.fixture(scope="session")
+def precomputed_table(replica, tmp_path_factory):
+    from scripts.precompute_combinations import DATA_DIR, precompute
+
+    output_dir = str(tmp_path_factory.mktemp("precomputed"))
+    table = precompute(DATA_DIR, workers=2)
+    with open(precomputed.precomputed_path(table["data_version"], output_dir), "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False)
+    return output_dir, table
+
+
+@pytest.fixture
+def precomputed_dir(precomputed_table, monkeypatch):
+    output_dir, _ = precomputed_table
+    monkeypatch.setattr(precomputed, "PRECOMPUTED_DIR", output_dir)
+    return output_dir
+
+
+@pytest.fixture(params=["database", "cache"])
+def live_path(request, db, monkeypatch):
+    # Live-Lösung einmal direkt aus der Datenbank und einmal aus dem Startup-Cache
+    monkeypatch.setattr(data_cache, "_cache", None)
+    if request.param == "cache":
+        data_cache.preload(db)
+    return request.param
+
+
+def test_table_matches_loaded_data_version(db, precomputed_table):
+    _, table = precomputed_table
+    assert table["data_version"] == current_data_version(db)
+
+
+def test_team_lookup_matches_live_solve(db, precomputed_dir, live_path):
+    team = "Deutschland"
+    games = db.query(Game).filter((Game.team_home == team) | (Game.team_away == team)).all()
+
+    assert precomputed.lookup_team(db, team) == solve_for_games(games, db)
+
+
+def test_tournament_lookup_matches_live_solve(db, precomputed_dir, live_path):
+    tournament = "Europameisterschaft 2024"
+    games = db.query(Game).filter(Game.tournament_name == tournament).all()
+
+    assert precomputed.lookup_tournament(db, tournament) == solve_for_games(games, db)
+
+
+def test_missing_file_is_not_cached(db, precomputed_table, tmp_path, monkeypatch):
+    monkeypatch.setattr(precomputed, "PRECOMPUTED_DIR", str(tmp_path))
+    assert precomputed.lookup_team(db, "Deutschland") is None
+
+    # Datei erscheint erst nach dem Start: muss ohne Neustart gefunden werden
+    _, table = precomputed_table
+    with open(precomputed.precomputed_path(table["data_version"]), "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False)
+
+    assert precomputed.lookup_team(db, "Deutschland") == table["teams"]["Deutschland"]
+
+
+def test_table_for_other_version_is_ignored(db, precomputed_table, tmp_path, monkeypatch):
+    monkeypatch.setattr(precomputed, "PRECOMPUTED_DIR", str(tmp_path))
+    _, table = precomputed_table
+    with open(precomputed.precomputed_path("other"), "w", encoding="utf-8") as f:
+        json.dump({**table, "data_version": "other"}, f)
+
+    assert precomputed.lookup_team(db, "Deutschland") is None
+
+
+def test_repeated_lookups_do_not_query_the_database(db, precomputed_dir):
+    precomputed.lookup_team(db, "Deutschland")
+    statements = []
+
+    def listener(connection, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(read_engine, "before_cursor_execute", listener)
+    try:
+        for _ in range(10):
+            assert precomputed.lookup_team(db, "Deutschland") is not None
+    finally:
+        event.remove(read_engine, "before_cursor_execute", listener)
+
+    assert statements == []
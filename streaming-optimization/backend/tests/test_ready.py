@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import data_cache, warmup
+
+
+def wait_for_status(client, *statuses, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get("/ready")
+        if response.json()["status"] in statuses:
+            return response
+        time.sleep(0.01)
+    raise AssertionError(f"Status {statuses} nicht erreicht: {response.json()}")
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(warmup, "STARTUP_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(warmup, "STARTUP_RETRY_DELAY", 0.01)
+    monkeypatch.setattr(data_cache, "_cache", None)
+    # Zustand aus vorherigen Tests zurücksetzen, bevor der Startup-Thread läuft
+    monkeypatch.setattr(warmup, "_state", {"status": "starting", "current_step": None, "steps": [], "error": None, "duration_ms": None})
+
+
+def test_ready_returns_503_until_startup_finishes(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(warmup, "STARTUP_STEPS", [("blocking", lambda: release.wait(10))])
+
+    with TestClient(app) as client:
+        response = wait_for_status(client, "starting")
+        assert response.status_code == 503
+        assert response.json()["current_step"] == "blocking"
+        assert client.get("/health").status_code == 200
+
+        release.set()
+        response = wait_for_status(client, "ready")
+        assert response.status_code == 200
+        assert response.json()["steps"][0]["name"] == "blocking"
+
+
+def test_failed_step_is_retried(monkeypatch):
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RuntimeError("database not reachable")
+
+    monkeypatch.setattr(warmup, "STARTUP_STEPS", [("flaky", flaky)])
+
+    with TestClient(app) as client:
+        response = wait_for_status(client, "ready")
+        assert response.status_code == 200
+        assert [step["ok"] for step in response.json()["steps"]] == [False, True]
+
+
+def test_failed_startup_is_reported(monkeypatch):
+    def broken():
+        raise RuntimeError("database not reachable")
+
+    monkeypatch.setattr(warmup, "STARTUP_STEPS", [("broken", broken)])
+
+    with TestClient(app) as client:
+        response = wait_for_status(client, "failed")
+        assert response.status_code == 503
+        assert response.json()["error"] == "broken: database not reachable"
+        assert len(response.json()["steps"]) == 3
+
+        health = client.get("/health")
+        assert health.status_code == 503
+        assert health.json()["status"] == "unhealthy"
+
+
+def test_shutdown_stops_pending_retries(monkeypatch):
+    monkeypatch.setattr(warmup, "STARTUP_RETRY_DELAY", 60)
+    monkeypatch.setattr(warmup, "STARTUP_STEPS", [("broken", lambda: 1 / 0)])
+
+    started = time.monotonic()
+    with TestClient(app) as client:
+        wait_for_status(client, "starting")
+        while not client.get("/ready").json()["steps"]:
+            time.sleep(0.01)
+
+    assert time.monotonic() - started < 10
+    assert warmup.readiness_report()["status"] == "stopped"
+
+
+def test_startup_against_replica(replica):
+    with TestClient(app) as client:
+        response = wait_for_status(client, "ready", "failed")
+
+        assert response.status_code == 200, response.json()
+        assert [step["name"] for step in response.json()["steps"]] == [
+            "connection_pool",
+            "precomputed_combinations",
+            "preload_data",
+            "warmup_queries",
+        ]
+        assert client.get("/api/games/teams").json() == data_cache._cache["teams"]
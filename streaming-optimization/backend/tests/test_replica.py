@@ -0,0 +1,118 @@
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+
+import pandas as pd
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.db import database
+from app.main import app
+from app.models import Game, StreamingOffer, StreamingPackage
+from app.services.data_version import current_data_version, csv_data_version
+from scripts.load_data import DATA_DIR
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_read_engine_uses_replica(replica):
+    assert database.read_engine.dialect.name == "sqlite"
+    assert database.read_engine is not database.engine
+
+
+def test_replica_contains_csv_data(db):
+    assert db.query(Game).count() == len(pd.read_csv(os.path.join(DATA_DIR, "bc_game.csv")))
+    assert db.query(StreamingPackage).count() == len(pd.read_csv(os.path.join(DATA_DIR, "bc_streaming_package.csv")))
+    assert db.query(StreamingOffer).count() == len(pd.read_csv(os.path.join(DATA_DIR, "bc_streaming_offer.csv")))
+    assert current_data_version(db) == csv_data_version(DATA_DIR)
+
+
+def test_replica_is_read_only(db):
+    with pytest.raises(OperationalError):
+        db.execute(text("DELETE FROM games"))
+    db.rollback()
+
+
+def test_endpoints_run_without_postgres(replica):
+    client = TestClient(app)
+
+    response = client.get("/api/packages/ranked", params={"teams": ["Deutschland"]})
+
+    assert response.status_code == 200
+    assert response.json()[0]["streamed_matches"] > 0
+
+
+@pytest.fixture
+def rebuilt_replica(replica, tmp_path):
+    """Legt eine geänderte Kopie der Replik an und stellt danach das Original wieder her."""
+    backup = tmp_path / "backup.sqlite"
+    rebuilt = tmp_path / "rebuilt.sqlite"
+    shutil.copy(replica, backup)
+    shutil.copy(replica, rebuilt)
+    with sqlite3.connect(rebuilt) as connection:
+        connection.execute("UPDATE data_version SET version = 'rebuilt'")
+    yield rebuilt
+    shutil.move(backup, replica)
+    database.refresh_read_engine()
+
+
+def read_version():
+    sessions = database.get_read_db()
+    try:
+        return current_data_version(next(sessions))
+    finally:
+        sessions.close()
+
+
+def test_swapped_replica_is_picked_up(replica, rebuilt_replica):
+    assert read_version() == csv_data_version(DATA_DIR)
+
+    shutil.move(rebuilt_replica, replica)
+
+    assert read_version() == "rebuilt"
+
+
+def test_swap_after_warm_up_is_picked_up_by_first_request(replica, rebuilt_replica, tmp_path):
+    # Frischer Prozess: der Warm-up füllt den Pool, bevor get_read_db zum ersten Mal nach der Datei sieht
+    replica_copy = tmp_path / "replica.sqlite"
+    shutil.copy(replica, replica_copy)
+    script = f"""
+import os, shutil
+from app.db import database
+from app.services import warmup
+from app.services.data_version import current_data_version
+
+warmup._warm_pool()
+shutil.move({str(rebuilt_replica)!r}, {str(replica_copy)!r})
+versions = []
+for _ in range(3):
+    sessions = database.get_read_db()
+    versions.append(current_data_version(next(sessions)))
+    sessions.close()
+print(",".join(versions))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "READ_REPLICA_PATH": str(replica_copy)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "rebuilt,rebuilt,rebuilt"
+
+
+def test_teams_without_cache_come_from_database(replica, monkeypatch):
+    from app.services import data_cache
+
+    monkeypatch.setattr(data_cache, "_cache", None)
+    teams = TestClient(app).get("/api/games/teams").json()
+
+    assert "Deutschland" in teams
+    assert teams == sorted(teams)